@@ -1,4 +1,5 @@
 from decimal import Decimal
+from functools import lru_cache
 from typing import TYPE_CHECKING, Iterable, Union
 
 from babel.numbers import get_currency_precision
@@ -10,10 +11,14 @@ if TYPE_CHECKING:
 MoneyTypes = Union["TaxedMoney", "Money", Decimal, "TaxedMoneyRange"]
 
 
-def quantize_price(price: MoneyTypes, currency: str) -> MoneyTypes:
+@lru_cache(maxsize=None)
+def _get_currency_exponent(currency: str) -> Decimal:
     precision = get_currency_precision(currency)
-    number_places = Decimal(10) ** -precision
-    return price.quantize(number_places)
+    return Decimal(10) ** -precision
+
+
+def quantize_price(price: MoneyTypes, currency: str) -> MoneyTypes:
+    return price.quantize(_get_currency_exponent(currency))
 
 
 def quantize_price_fields(model: "Model", fields: Iterable[str], currency: str) -> None: